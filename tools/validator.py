@@ -54,19 +54,14 @@
 # #################### IMPORT ##########################################################
 
 from sys import exit
-from re import match
-from os import system, stat, popen, path
+import re
+from os import system, path, makedirs
+from shutil import move, rmtree
+from subprocess import run, DEVNULL, TimeoutExpired
+from mmap import mmap, ACCESS_READ
 from argparse import ArgumentParser
 
 # ##################### GLOBALS ########################################################
-witness = None          # input stream
-output = None           # output stream
-symbols = []            # holds current line of the input file split by blanks
-symbol = ""             # holds the current symbol
-props = []              # holds properties of the witness
-memory_constraints = [] # memory assignments encoded in the witness
-frame_content = []      # holds the content of the current frame
-frame_number = -1       # number of current frame
 
 # bad states are defined in the BTOR2 file and generated by selfie
 bad_states = { "b0" : "ecall invalid syscall",
@@ -80,211 +75,286 @@ bad_states = { "b0" : "ecall invalid syscall",
                "b8" : "memory access at or above upper bound",
                "b9" : "word-unaligned memory access"}
 
+# error texts printed by selfie when running into the corresponding bad state
+# (text of the non-zero exit code bad-state "b1" depends on the bad exit code)
+error_texts = { "b0" : "unknown system call",
+                "b2" : "division by zero",
+                "b3" : "division by zero",
+                "b4" : "uncaught invalid address",
+                "b5" : "uncaught invalid address",
+                "b6" : "uncaught invalid address",
+                "b7" : "uncaught invalid address",
+                "b8" : "uncaught invalid address",
+                "b9" : "uncaught invalid address"}
+
+# token classes of the witness format, matched in a single pass over its bytes
+# (tokens are separated by blanks, every line break is a token itself)
+# according to EBNF, semicolons can only appear at start of line
+# ";" starts a comment -> whole line is a single comment token that is skipped
+TOKEN_RE = re.compile(rb'(?P<comment>^;[^\n]*\n?)'
+                      rb'|(?P<newline>\n)'
+                      rb'|(?P<arr>\[(?P<address>[01]+)\])(?!\S)'
+                      rb'|(?P<bv>[01]+)(?!\S)'
+                      rb'|(?P<prop>[bj][0-9]+)(?!\S)'
+                      rb'|(?P<state>#[0-9]+)(?!\S)'
+                      rb'|(?P<frame>@(?P<frame_number>[0-9]+))(?!\S)'
+                      rb'|(?P<word>\S+)', re.MULTILINE)
+
+# files of at least this size [B] are memory-mapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY LIBRARY
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-# returns the next symbol of the input file
-def get_symbol():
-    global symbols
-    global symbol
-
-    # read next line
-    if len(symbols) == 0:
-        symbols = witness.readline().strip().split(" ")
-        symbols.append("\n")
-
-    # according to EBNF, semicolons can only appear at start of line
-    # ";" starts a comment -> ignore line after ;
-    while symbols[0][0] == ";":
-        symbols.clear()
-        symbols = witness.readline().strip().split(" ")
-        symbols.append("\n")
-
-    # write next symbol in symbol variable
-    symbol = symbols.pop(0)
+# prints colored messages: debug information, progress, success and errors
+def info(message: str):
+    print(f"\033[94m{message}\033[0m")
 
 
-# writes error-causing program-input to file
-def generate_output(frame):
-    global output
+def status(message: str):
+    print(f"\033[93m{message}\033[0m")
 
-    # (0*) bit-vectors are filtered out
-    frame = list(filter(lambda x: int(x, 2) != 0, frame))
 
-    if len(frame) > 1:
-        print("\033[91mWarning: Frame " + frame_number + " is invalid due to multiple input values!\033[0m")
-
-    elif len(frame) == 1:
-        frame = frame[0]  # simplification since only one element in list
-
-        if args.debug:
-            print("\033[94mValue: " + str(int(frame, 2)) + " at frame " + frame_number + "\033[0m")
+def ok(message: str):
+    print(f"\033[92m{message}\033[0m")
 
-        try:
 
-            # split into bytes
-            for i in range(int(len(frame)/8), 0, -1):
-                if args.debug:
-                    print("\033[94mByte#" + str(i) + " = " + str(frame[(i-1)*8: i*8]) + "\033[0m")
-                output.write(chr(int(frame[(i-1)*8 : i*8], 2)))  # write corresponding char to file
+def error(message: str):
+    print(f"\033[91m{message}\033[0m")
 
-        except OverflowError:
-            print("\033[91mInput Overflow at Frame " + frame_number + "\033[0m")
 
+# returns the content of the file at file_path, large files are memory-mapped
+# note: use find instead of the in operator to search for bytes in the content
+def read_file(file_path: str):
+    with open(file_path, "rb") as file:
+        if path.getsize(file_path) < MMAP_THRESHOLD:
+            return file.read()
+        else:
+            # the mapping stays valid after the file is closed
+            return mmap(file.fileno(), 0, access=ACCESS_READ)
 
-# ################### PARSER FUNCTIONS ###############################################
 
-# throws an parser error and exits the program
-def parser_error(expected: str):
-    global symbol
+# converts a duration of the timeout tool (example: 10s, 5m, 1h) into seconds, 0 disables the timeout
+def timeout_seconds(duration: str):
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
 
-    if type(expected) == str:
-        print("\033[91mParser Error: '" + expected + "' expected but '" + symbol + "' found!\033[0m")
-        exit(3)
+    if duration[-1:] in units:
+        seconds = float(duration[:-1]) * units[duration[-1]]
     else:
-        print("\033[91mInternal error: argument is not a String!\033[0m")
+        seconds = float(duration)
+
+    return seconds if seconds > 0 else None
+
+
+# ################### WITNESS PARSER ##################################################
+
+# parser for Boolectors witness format, holds the whole parser state
+class WitnessParser:
+    __slots__ = ("witness", "output", "tokens", "current_token", "token_type", "symbol",
+                 "props", "memory_constraints", "frame_content", "frame_number", "input_bytes")
+
+    def __init__(self, witness, output):
+        self.witness = witness            # content of the witness file
+        self.output = output              # output stream
+        self.tokens = None                # iterator over the tokens of the input file
+        self.current_token = None         # holds the match of the current symbol
+        self.token_type = ""              # token class of the current symbol
+        self.symbol = b""                 # holds the current symbol
+        self.props = []                   # holds properties of the witness
+        self.memory_constraints = []      # memory assignments encoded in the witness
+        self.frame_content = []           # holds the non-zero bit-vectors of the current frame
+        self.frame_number = -1            # number of current frame
+        self.input_bytes = bytearray()    # error-causing program-input of all frames parsed so far
+
+    # returns the next symbol of the input file
+    def get_symbol(self):
+        self.current_token = next(self.tokens, None)
+
+        # comments are skipped
+        while self.current_token and self.current_token.lastgroup == "comment":
+            self.current_token = next(self.tokens, None)
+
+        # write next symbol and its token class, both empty at end of file
+        if self.current_token:
+            self.symbol = self.current_token.group()
+            self.token_type = self.current_token.lastgroup
+        else:
+            self.symbol = b""
+            self.token_type = ""
 
+    # splits the whole witness into tokens at once, works on bytes and memory-mapped files
+    def tokenize(self, content):
+        self.tokens = TOKEN_RE.finditer(content)
 
-# EBNF: "[" binary_string "]" binary_string
-def parse_array_assignment():
-    global memory_constraints
+    # appends error-causing program-input of the current frame to input_bytes
+    def generate_output(self, frame):
+        if len(frame) > 1:
+            error("Warning: Frame " + str(self.frame_number) + " is invalid due to multiple input values!")
 
-    memory_address = int(symbol.strip("[]"), 2)
-    get_symbol()
+        elif len(frame) == 1:
+            frame = frame[0]  # simplification since only one element in list
 
-    if match(r'[01]+', symbol):
-        value = int(symbol, 2)
-        get_symbol()
-    else:
-        parser_error("binary string")
+            if args.debug:
+                info("Value: " + str(int(frame, 2)) + " at frame " + str(self.frame_number))
 
-    memory_constraints.append([memory_address, value])
+            # bytes are written least significant first, trailing bits beyond full bytes are ignored
+            number_of_bytes = len(frame) // 8
+            data = (int(frame, 2) >> len(frame) % 8).to_bytes(number_of_bytes, "little")
 
+            if args.debug:
+                for i, byte in enumerate(data):
+                    info("Byte#" + str(number_of_bytes - i) + " = " + format(byte, "08b"))
 
-# EBNF: binary_string
-def parse_bv_assignment():
-    global frame_content
-
-    if match(r'[01]+', symbol):
-        frame_content.append(symbol)
-        get_symbol()
-    else:
-        parser_error("binary string")
+            self.input_bytes += data
 
+    # throws an parser error and exits the program
+    def parser_error(self, expected: str):
+        if type(expected) == str:
+            error("Parser Error: '" + expected + "' expected but '" + self.symbol.decode(errors="replace") + "' found!")
+            exit(3)
+        else:
+            error("Internal error: argument is not a String!")
 
-# EBNF: uint ( bv_assignment | array_assignment ) [ symbol ]
-def parse_assignment():
-    if match(r'\[[01]+\]', symbol):
-        parse_array_assignment()
-    else:
-        parse_bv_assignment()
+    # EBNF: "[" binary_string "]" binary_string
+    def parse_array_assignment(self):
+        memory_address = int(self.current_token["address"], 2)
+        self.get_symbol()
 
-    if len(symbols) == 1:
-        # symbol holds optional symbol after assignment
-        get_symbol()
+        if self.token_type == "bv":
+            value = int(self.symbol, 2)
+            self.get_symbol()
+        else:
+            self.parser_error("binary string")
 
+        self.memory_constraints.append([memory_address, value])
 
-# EBNF: { comment "\n" | assignment "\n" }
-def parse_model():
-    # comments are handled globally
-    while symbol.isnumeric():
-        get_symbol()
+    # EBNF: binary_string
+    def parse_bv_assignment(self):
+        if self.token_type == "bv":
+            # (0*) bit-vectors are filtered out
+            if b"1" in self.symbol:
+                self.frame_content.append(self.symbol)
 
-        parse_assignment()
+            self.get_symbol()
+        else:
+            self.parser_error("binary string")
 
-        if symbol == "\n":
-            get_symbol()
+    # EBNF: uint ( bv_assignment | array_assignment ) [ symbol ]
+    def parse_assignment(self):
+        if self.token_type == "arr":
+            self.parse_array_assignment()
         else:
-            parser_error("\n")
+            self.parse_bv_assignment()
 
+        if self.symbol != b"\n":
+            # symbol holds optional symbol after assignment
+            self.get_symbol()
 
-# EBNF: "#" uint "\n" model
-def parse_state_part():
-    if match(r'#[0-9]+', symbol):
-        get_symbol()
+    # EBNF: { comment "\n" | assignment "\n" }
+    def parse_model(self):
+        # bound methods are looked up once for the whole loop
+        get_symbol = self.get_symbol
+        parse_assignment = self.parse_assignment
 
-        if symbol == "\n":
+        # comments are skipped by get_symbol
+        while self.symbol.isdigit():
             get_symbol()
 
-            parse_model()
+            parse_assignment()
 
+            if self.symbol == b"\n":
+                get_symbol()
+            else:
+                self.parser_error("\n")
 
-# EBNF: "@" uint "\n" model
-def parse_input_part():
-    global frame_number
-    if match(r'@[0-9]+', symbol):
-        frame_number = symbol.strip('@')
-        get_symbol()
+    # EBNF: "#" uint "\n" model
+    def parse_state_part(self):
+        if self.token_type == "state":
+            self.get_symbol()
 
-        if symbol == "\n":
-            get_symbol()
+            if self.symbol == b"\n":
+                self.get_symbol()
 
-            parse_model()
+                self.parse_model()
 
-        else:
-            parser_error("\n")
-    else:
-        parser_error("@uint")
+    # EBNF: "@" uint "\n" model
+    def parse_input_part(self):
+        if self.token_type == "frame":
+            self.frame_number = int(self.current_token["frame_number"])
+            self.get_symbol()
 
+            if self.symbol == b"\n":
+                self.get_symbol()
 
-# EBNF: [ state_part ] input_part
-def parse_frame():
-    global frame_content
-    frame_content = []
+                self.parse_model()
 
-    parse_state_part()
-    parse_input_part()
+            else:
+                self.parser_error("\n")
+        else:
+            self.parser_error("@uint")
 
-    generate_output(frame_content)
+    # EBNF: [ state_part ] input_part
+    def parse_frame(self):
+        self.frame_content = []
 
+        self.parse_state_part()
+        self.parse_input_part()
 
-# EBNF: ( "b" | "j" ) uint
-def parse_prop():
-    if match(r'([bj][0-9]+\n?)', symbol):
-        props.append(symbol.strip())
-        get_symbol()
-    else:
-        parser_error("Witness Property")
+        self.generate_output(self.frame_content)
 
+    # EBNF: ( "b" | "j" ) uint
+    def parse_prop(self):
+        if self.token_type == "prop":
+            self.props.append(self.symbol.decode())
+            self.get_symbol()
+        else:
+            self.parser_error("Witness Property")
 
-# EBNF: "sat\n" { prop } "\n"
-def parse_header():
-    if symbol == "sat":
-        get_symbol()
+    # EBNF: "sat\n" { prop } "\n"
+    def parse_header(self):
+        if self.symbol == b"sat":
+            self.get_symbol()
 
-        if symbol == "\n":
-            get_symbol()
+            if self.symbol == b"\n":
+                self.get_symbol()
 
-            while symbol != "\n":
-                parse_prop()
+                parse_prop = self.parse_prop
 
-            get_symbol()
+                while self.symbol != b"\n":
+                    parse_prop()
 
-            if args.debug:
-                print("\033[94mProperties: " + str(props) + "\033[0m")
+                self.get_symbol()
+
+                if args.debug:
+                    info("Properties: " + str(self.props))
 
+            else:
+                self.parser_error("\n")
         else:
-            parser_error("\n")
-    else:
-        parser_error("sat")
+            self.parser_error("sat")
 
+    # EBNF: { comment "\n" } | header { frame } "."
+    def parse_witness(self):
+        # comments are skipped by get_symbol
+        self.tokenize(self.witness)
 
-# EBNF: { comment "\n" } | header { frame } "."
-def parse_witness():
-    # comments are handled globally
+        # get initial symbol
+        self.get_symbol()
 
-    # get initial symbol
-    get_symbol()
+        self.parse_header()
 
-    parse_header()
+        parse_frame = self.parse_frame
 
-    while symbol != ".":
-        parse_frame()
+        while self.symbol != b".":
+            parse_frame()
 
-    if args.debug:
-        print("\033[94mParsing Witness finished\033[0m")
+        # write input bytes of all frames to file at once
+        self.output.write(self.input_bytes)
+
+        if args.debug:
+            info("Parsing Witness finished")
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -307,7 +377,7 @@ arguments.add_argument("-b", "--btormc", dest="btormc_path", default="btormc",
                        help="path to btormc executable")
 arguments.add_argument("-ts", "--timeout_selfie", dest="selfie_timeout", default="10s",
                        help="timeout for execution of in_file on mipster (example: 10s, 5m, 1h)")
-arguments.add_argument("-tb", "--timeout_btormc", dest="btormc_timeout", default="10m",
+arguments.add_argument("-tb", "--timeout_btormc", dest="btormc_timeout", type=timeout_seconds, default="10m",
                        help="timeout for execution of btormc with the generated btor2 file (example: 10s, 10m, 1h)")
 arguments.add_argument("-kmax", dest="kmax", type=int, default=10000, help="-kmax parameter for btormc")
 arguments.add_argument("-mem", "--memory", dest="memory", type=int, default="2", help="memory [MB] for mipster")
@@ -318,33 +388,46 @@ args = arguments.parse_args()
 
 # ################### GENERATING WITNESS ##############################################
 # directory for temporary files
-system("mkdir -p temp")
+makedirs("temp", exist_ok=True)
 if args.debug:
-    print("\033[94mtemp directory built")
+    info("temp directory built")
 
 # --------- generating btor2 file -----------------------------
-print("\033[93mgenerating BTOR2 file using beator...\033[0m")
+status("generating BTOR2 file using beator...")
 
-if args.debug:
-    system(args.beator_path + " -c " + args.in_file + " - " + str(args.bad_exit_code))
-else:
-    # beator output is discarded
-    system(args.beator_path + " -c " + args.in_file + " - " + str(args.bad_exit_code) + " 1 > /dev/null")
+try:
+    # beator output is discarded unless in debug mode
+    run([args.beator_path, "-c", args.in_file, "-", str(args.bad_exit_code)],
+        stdout=None if args.debug else DEVNULL)
+except FileNotFoundError as e:
+    print(e.strerror + ": " + args.beator_path)
+    exit(2)
 
 btor_name = path.splitext(args.in_file)[0]
-system("mv " + btor_name + ".btor2 ./temp/model.btor2")
+try:
+    move(btor_name + ".btor2", "./temp/model.btor2")
+except FileNotFoundError as e:
+    print(e.strerror + ": " + btor_name + ".btor2")
 
 if args.debug:
-    print("\033[94mBTOR2 model written to ./temp/model.btor2\033[0m")
+    info("BTOR2 model written to ./temp/model.btor2")
 
 # --------- generating witness ----------------------------------
-print("\033[93mgenerating witness using btormc...\033[0m")
-system('timeout ' + args.btormc_timeout + ' ' + args.btormc_path + ' -kmax ' + str(args.kmax)
-       + ' ./temp/model.btor2 > ./temp/witness.wit ; if [ $? = 124 ]; then echo "btormc timed out" ; '
-         'fi >> ./temp/witness.wit')
+status("generating witness using btormc...")
+try:
+    # btormc writes the witness directly into the file, it is killed on timeout
+    with open("./temp/witness.wit", "wb") as witness_file:
+        run([args.btormc_path, "-kmax", str(args.kmax), "./temp/model.btor2"],
+            stdout=witness_file, timeout=args.btormc_timeout)
+except FileNotFoundError as e:
+    print(e.strerror + ": " + args.btormc_path)
+    exit(2)
+except TimeoutExpired:
+    error("Error: btormc timed out!")
+    exit(4)
 
 if args.debug:
-    print("\033[94mwitness written to ./temp/witness.wit\033[0m")
+    info("witness written to ./temp/witness.wit")
 
 
 # ################### PARSER ##########################################################
@@ -352,63 +435,58 @@ if args.debug:
 # open witness -------------------------------
 try:
 
-    # check if an error was found
-    if stat("./temp/witness.wit").st_size == 0:
-        print("\033[92mNo error state found!\033[0m")
-        exit(0)
-
-    # popen returns an iterabel objects of stdout lines
-    result = [line.strip("\n") for line in popen('cat ./temp/witness.wit | grep -c "btormc timed out"')]
-
-    if result[0] == '1':
-        print("\033[91mError: btormc timed out!\033[0m")
-        exit(4)
-
-    witness = open("./temp/witness.wit", "r")
+    # witness is read once for the check and the parser
+    witness = read_file("./temp/witness.wit")
 
     if args.debug:
-        print("\033[94mWitness file opened.\033[0m")
+        info("Witness file read.")
 
 except FileNotFoundError as e:
     print(e.strerror + ": " + args.in_file)
     exit(2)
 
+# check if an error was found
+if not witness:
+    ok("No error state found!")
+    exit(0)
+
 
 # open output file -----------------------------
-output = open("./temp/error_input.txt", "w")
+# binary mode, input bytes are written as they are
+output = open("./temp/error_input.txt", "wb")
 
 if args.debug:
-    print("\033[94mOutput file opened.\033[0m")
+    info("Output file opened.")
 
 
-print("\033[93mparsing witness...\033[0m")
-parse_witness()
+status("parsing witness...")
+parser = WitnessParser(witness, output)
+parser.parse_witness()
 
 
 if args.debug:
-    print("\033[94mNumber of Frames parsed: " + frame_number + "\033[0m")
+    info("Number of Frames parsed: " + str(parser.frame_number))
 
-for b in props:
-    print("\033[93m" + bad_states[b] + " error state found!\033[0m")
+for b in parser.props:
+    status(bad_states[b] + " error state found!")
 
-if len(memory_constraints) > 0:
-    print("\033[93mMemory constraints:\033[0m")
-    for x in memory_constraints:
-        print("\033[93m  Value: " + str(x[1]) + " at address " + str(x[0]) + "\033[0m")
+if len(parser.memory_constraints) > 0:
+    status("Memory constraints:")
+    for x in parser.memory_constraints:
+        status("  Value: " + str(x[1]) + " at address " + str(x[0]))
 
 if args.debug:
-    print("\033[94mError causing input written to " + output.name + "\033[0m")
+    info("Error causing input written to " + output.name)
 
-witness.close()
 output.close()
 
 if args.debug:
-    print("\033[94mInput and Output Stream closed.\033[0m")
+    info("Output Stream closed.")
 
 
 # #################### EXECUTE CODE WITH CALCULATED INPUT #####################################
 
-print("\033[93mExecuting " + args.in_file + " on Mipster with calculated input...\033[0m")
+status("Executing " + args.in_file + " on Mipster with calculated input...")
 
 # if selfie times out, the exitcode generated by the timeout tool is 124
 system('timeout ' + args.selfie_timeout + ' ' + args.selfie_path + ' -c ' + args.in_file + ' -m ' + str(args.memory)
@@ -416,53 +494,56 @@ system('timeout ' + args.selfie_timeout + ' ' + args.selfie_path + ' -c ' + args
          ' fi >> ./temp/selfie_out.txt')
 
 # check if selfie timed out --------------------------------------------------
-# popen returns an iterabel objects of stdout lines
-result = [line.strip("\n") for line in popen('cat ./temp/selfie_out.txt | grep -c "selfie timed out"')]
+# selfie output is read once and searched in memory
+selfie_out = read_file("./temp/selfie_out.txt")
 
-if result[0] == '1':
-    print("\033[91mError: Selfie timed out!\033[0m")
+if selfie_out.find(b"selfie timed out") != -1:
+    error("Error: Selfie timed out!")
     exit(4)
 
 # ##################### SEARCH FOR EXPECTED ERROR ####################################
 
-for b in props:
-    if b == 'b0':
-        print("\033[91mHow the Hell did you get this error?\n\033[0m")
-        error_text = '"unknown system call"'
-    elif b == 'b1':
-        error_text = '"exit code ' + str(args.bad_exit_code) + '"'
-    elif b == 'b2' or b == 'b3':
-        error_text = '"division by zero"'
-    elif b == 'b4' or b == 'b5' or b == 'b6' or b == 'b7' or b == 'b8' or b == 'b9':
-        error_text = '"uncaught invalid address"'
+# bad states may share their error text, each text is searched only once
+error_text_found = {}
+
+for b in parser.props:
+    if b == "b1":
+        error_text = "exit code " + str(args.bad_exit_code)
     else:
+        error_text = error_texts.get(b)
+
+    if error_text is None:
         # this should be unreachable
-        print("\033[91mInternal Error - unknown bad state!\033[0m")
+        error("Internal Error - unknown bad state!")
         exit(5)
 
+    if b == "b0":
+        error("How the Hell did you get this error?\n")
+
     if args.debug:
-        print("\033[94mError text: " + error_text + "\033[0m")
+        info("Error text: \"" + error_text + "\"")
 
-    # search for error text is selfie output
-    result = [line.strip("\n") for line in popen('cat temp/selfie_out.txt | grep -c ' + error_text)]
+    # search for error text in selfie output, stops at the first occurrence
+    if error_text not in error_text_found:
+        error_text_found[error_text] = selfie_out.find(error_text.encode()) != -1
 
-    if int(result[0]) > 0:
-        print("\033[92m" + bad_states[b] + " error verified!\033[0m")
+    if error_text_found[error_text]:
+        ok(bad_states[b] + " error verified!")
         exitcode = 0
     else:
         # if the file is reading from stdout, a wrong input is taken from "selfie_out.txt" and no timeout is triggered
-        print("\033[91m" + bad_states[b] + " error could not be verified. \n"
-                                           "consider memory constraints and make sure the C* file is reading from stdin!\033[0m")
+        error(bad_states[b] + " error could not be verified. \n"
+                              "consider memory constraints and make sure the C* file is reading from stdin!")
         exitcode = 1
 
 
 # ######################### CLEANUP ############################################
 # If debug mode is on, the generated files are kept for debugging purpose, else they are removed
 if not args.debug:
-    print("\033[93mCleanup: removing temp directory (use debug mode to keep the files)\033[0m")
-    system("rm -r ./temp")
+    status("Cleanup: removing temp directory (use debug mode to keep the files)")
+    rmtree("./temp")
 else:
-    print("\033[94mAll generated files in temp directory!\033[0m")
+    info("All generated files in temp directory!")
 
 # exits with 0 if error was verified, else with 1
 exit(exitcode)